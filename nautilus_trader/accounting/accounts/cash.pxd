@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
@@ -23,6 +24,7 @@ from nautilus_trader.model.objects cimport Quantity
 
 
 cdef class CashAccount(Account):
+    cdef Logger _log
     cdef dict _balances_locked
 
 # -- COMMANDS -------------------------------------------------------------------------------------
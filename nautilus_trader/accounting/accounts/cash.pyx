@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport LiquiditySide
@@ -60,6 +61,7 @@ cdef class CashAccount(Account):
 
         super().__init__(event, calculate_account_state)
 
+        self._log = Logger(name=type(self).__name__)
         self._balances_locked: dict[InstrumentId, Money] = {}
 
     @staticmethod
@@ -150,7 +152,7 @@ cdef class CashAccount(Account):
         cdef AccountBalance current_balance = self._balances.get(currency)
         if current_balance is None:
             # TODO: Temporary pending reimplementation of accounting
-            print("Cannot recalculate balance when no current balance")
+            self._log.warning(f"Cannot recalculate balance when no current balance for {currency}")
             return
 
         total_locked = Decimal(0)
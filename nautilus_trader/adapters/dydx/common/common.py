@@ -16,7 +16,7 @@
 from nautilus_trader.config import NautilusConfig
 
 
-class DYDXOrderTags(NautilusConfig, frozen=True, repr_omit_defaults=True):
+class DYDXOrderTags(NautilusConfig, frozen=True, repr_omit_defaults=True, gc=False):
     """
     Used to attach to Nautilus Order Tags for dYdX specific order parameters.
     """
@@ -22,7 +22,7 @@ from nautilus_trader.config import PositiveFloat
 from nautilus_trader.config import PositiveInt
 
 
-class DYDXDataClientConfig(LiveDataClientConfig, frozen=True):
+class DYDXDataClientConfig(LiveDataClientConfig, frozen=True, gc=False):
     """
     Configuration for ``DYDXDataClient`` instances.
 
@@ -48,7 +48,7 @@ class DYDXDataClientConfig(LiveDataClientConfig, frozen=True):
     max_ws_reconnection_tries: int | None = 3
 
 
-class DYDXExecClientConfig(LiveExecClientConfig, frozen=True):
+class DYDXExecClientConfig(LiveExecClientConfig, frozen=True, gc=False):
     """
     Configuration for ``DYDXExecutionClient`` instances.
 
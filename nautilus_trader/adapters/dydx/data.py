@@ -115,6 +115,19 @@ class DYDXDataClient(LiveMarketDataClient):
 
         self._enum_parser = DYDXEnumParser()
 
+        # Register websocket message handlers by (channel, type)
+        self._ws_handlers: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
+            ("v4_orderbook", "channel_data"): self._handle_orderbook,
+            ("v4_orderbook", "subscribed"): self._handle_orderbook_snapshot,
+            ("v4_orderbook", "channel_batch_data"): self._handle_orderbook_batched,
+            ("v4_trades", "channel_data"): self._handle_trade,
+            ("v4_trades", "subscribed"): self._handle_trade_subscribed,
+            ("v4_candles", "channel_data"): self._handle_kline,
+            ("v4_candles", "subscribed"): self._handle_kline_subscribed,
+            ("v4_markets", "channel_data"): self._handle_markets,
+            ("v4_markets", "subscribed"): self._handle_markets_subscribed,
+        }
+
         # Decoders
         self._decoder_ws_msg_general = msgspec.json.Decoder(DYDXWsMessageGeneral)
         self._decoder_ws_orderbook = msgspec.json.Decoder(DYDXWsOrderbookChannelData)
@@ -228,23 +241,12 @@ class DYDXDataClient(LiveMarketDataClient):
             self._cache.add_currency(currency)
 
     def _handle_ws_message(self, raw: bytes) -> None:
-        callbacks: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
-            ("v4_orderbook", "channel_data"): self._handle_orderbook,
-            ("v4_orderbook", "subscribed"): self._handle_orderbook_snapshot,
-            ("v4_orderbook", "channel_batch_data"): self._handle_orderbook_batched,
-            ("v4_trades", "channel_data"): self._handle_trade,
-            ("v4_trades", "subscribed"): self._handle_trade_subscribed,
-            ("v4_candles", "channel_data"): self._handle_kline,
-            ("v4_candles", "subscribed"): self._handle_kline_subscribed,
-            ("v4_markets", "channel_data"): self._handle_markets,
-            ("v4_markets", "subscribed"): self._handle_markets_subscribed,
-        }
         try:
             ws_message = self._decoder_ws_msg_general.decode(raw)
-            key = (ws_message.channel, ws_message.type)
+            handler = self._ws_handlers.get((ws_message.channel, ws_message.type))
 
-            if key in callbacks:
-                callbacks[key](raw)
+            if handler is not None:
+                handler(raw)
                 return
 
             if ws_message.type == "unsubscribed":
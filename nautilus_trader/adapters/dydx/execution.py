@@ -19,6 +19,7 @@ Provide an execution client for the dYdX decentralized crypto exchange.
 import asyncio
 import secrets
 from collections import defaultdict
+from collections.abc import Callable
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
@@ -104,12 +105,18 @@ class ClientOrderIdHelper:
     Generate integer client order IDs.
     """
 
+    __slots__ = ("_cache", "_client_order_id_ints", "_client_order_ids")
+
     def __init__(self, cache: Cache) -> None:
         """
         Generate integer client order IDs.
         """
         self._cache = cache
 
+        # In-memory lookups in front of the Cache, which only holds raw bytes
+        self._client_order_id_ints: dict[ClientOrderId, int] = {}
+        self._client_order_ids: dict[int, ClientOrderId] = {}
+
     def generate_client_order_id_int(self, client_order_id: ClientOrderId) -> int:
         """
         Generate a unique client order ID integer and save it in the Cache.
@@ -127,13 +134,19 @@ class ClientOrderIdHelper:
         )
         self._cache.add(str(client_order_id_int), client_order_id.value.encode("utf-8"))
 
+        self._client_order_id_ints[client_order_id] = client_order_id_int
+        self._client_order_ids[client_order_id_int] = client_order_id
+
         return client_order_id_int
 
     def get_client_order_id_int(self, client_order_id: ClientOrderId) -> int | None:
         """
         Retrieve the ClientOrderId integer from the cache.
         """
-        result = None
+        result = self._client_order_id_ints.get(client_order_id)
+
+        if result is not None:
+            return result
 
         try:
             result = int(client_order_id.value)
@@ -149,6 +162,11 @@ class ClientOrderIdHelper:
         """
         Retrieve the ClientOrderId from the cache.
         """
+        client_order_id = self._client_order_ids.get(client_order_id_int)
+
+        if client_order_id is not None:
+            return client_order_id
+
         value = self._cache.get(str(client_order_id_int))
 
         if value is not None:
@@ -156,6 +174,17 @@ class ClientOrderIdHelper:
 
         return ClientOrderId(str(client_order_id_int))
 
+    def release(self, client_order_id: ClientOrderId) -> None:
+        """
+        Remove the in-memory lookups for a client order ID which reached a terminal state.
+
+        The Cache entries are kept, so late venue messages still resolve the order.
+        """
+        client_order_id_int = self._client_order_id_ints.pop(client_order_id, None)
+
+        if client_order_id_int is not None:
+            self._client_order_ids.pop(client_order_id_int, None)
+
 
 class DYDXExecutionClient(LiveExecutionClient):
     """
@@ -228,6 +257,12 @@ class DYDXExecutionClient(LiveExecutionClient):
         )
         self._set_account_id(account_id)
 
+        # Register websocket message handlers by (channel, type)
+        self._ws_handlers: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
+            ("v4_subaccounts", "channel_data"): self._handle_subaccounts_channel_data,
+            ("v4_subaccounts", "subscribed"): self._handle_subaccounts_subscribed,
+        }
+
         # WebSocket API
         self._ws_client = DYDXWebsocketClient(
             clock=clock,
@@ -259,7 +294,27 @@ class DYDXExecutionClient(LiveExecutionClient):
             DYDXWsSubaccountsChannelData,
         )
 
+        # Order submission maps
+        self._order_type_map: dict[OrderType, DYDXGRPCOrderType] = {
+            OrderType.LIMIT: DYDXGRPCOrderType.LIMIT,
+            OrderType.MARKET: DYDXGRPCOrderType.MARKET,
+            OrderType.STOP_MARKET: DYDXGRPCOrderType.STOP_MARKET,
+            OrderType.STOP_LIMIT: DYDXGRPCOrderType.STOP_LIMIT,
+        }
+        self._order_side_map: dict[OrderSide, int] = {
+            OrderSide.NO_ORDER_SIDE: DYDXOrder.Side.SIDE_UNSPECIFIED,
+            OrderSide.BUY: DYDXOrder.Side.SIDE_BUY,
+            OrderSide.SELL: DYDXOrder.Side.SIDE_SELL,
+        }
+        self._time_in_force_map: dict[TimeInForce, int] = {
+            TimeInForce.GTC: DYDXOrder.TimeInForce.TIME_IN_FORCE_UNSPECIFIED,
+            TimeInForce.GTD: DYDXOrder.TimeInForce.TIME_IN_FORCE_UNSPECIFIED,
+            TimeInForce.IOC: DYDXOrder.TimeInForce.TIME_IN_FORCE_IOC,
+            TimeInForce.FOK: DYDXOrder.TimeInForce.TIME_IN_FORCE_FILL_OR_KILL,
+        }
+
         # Hot caches
+        self._instrument_ids: dict[str, InstrumentId] = {}
         self._order_builders: dict[InstrumentId, OrderBuilder] = {}
         self._generate_order_status_retries: dict[ClientOrderId, int] = {}
 
@@ -276,6 +331,18 @@ class DYDXExecutionClient(LiveExecutionClient):
         # The instruments are used in the first account channel message.
         await self._instrument_provider.load_all_async()
 
+        # The websocket subscription and the account request are independent
+        _, account = await asyncio.gather(
+            self._connect_websocket(),
+            self._grpc_account.get_account(address=self._wallet_address),
+        )
+        self._wallet = Wallet(
+            mnemonic=self._mnemonic,
+            account_number=account.account_number,
+            sequence=account.sequence,
+        )
+
+    async def _connect_websocket(self) -> None:
         self._log.info("Initializing websocket connection")
 
         # Connect to websocket
@@ -287,20 +354,18 @@ class DYDXExecutionClient(LiveExecutionClient):
             subaccount_number=self._subaccount,
         )
 
-        account = await self._grpc_account.get_account(address=self._wallet_address)
-        self._wallet = Wallet(
-            mnemonic=self._mnemonic,
-            account_number=account.account_number,
-            sequence=account.sequence,
+    async def _disconnect(self) -> None:
+        await asyncio.gather(
+            self._disconnect_websocket(),
+            self._grpc_account.disconnect(),
         )
 
-    async def _disconnect(self) -> None:
+    async def _disconnect_websocket(self) -> None:
         await self._ws_client.unsubscribe_account_update(
             wallet_address=self._wallet_address,
             subaccount_number=self._subaccount,
         )
         await self._ws_client.disconnect()
-        await self._grpc_account.disconnect()
 
     def _stop(self) -> None:
         self._retry_manager_pool.shutdown()
@@ -313,10 +378,7 @@ class DYDXExecutionClient(LiveExecutionClient):
         order_side: OrderSide | None = None,
         order_type: OrderType | None = None,
     ) -> OrderStatusReport | None:
-        PyCondition.is_false(
-            client_order_id is None and venue_order_id is None,
-            "both `client_order_id` and `venue_order_id` were `None`",
-        )
+        # Identifier preconditions are checked by `generate_order_status_report`
         result = None
 
         instrument = self._cache.instrument(instrument_id)
@@ -491,8 +553,11 @@ class DYDXExecutionClient(LiveExecutionClient):
         )
 
         if dydx_orders is not None:
+            # All reports in the batch are initialized from the same response
+            ts_init = self._clock.timestamp_ns()
+
             for dydx_order in dydx_orders:
-                current_instrument_id = DYDXSymbol(dydx_order.ticker).to_instrument_id()
+                current_instrument_id = self._get_instrument_id(dydx_order.ticker)
                 instrument = self._cache.instrument(current_instrument_id)
 
                 if instrument is None:
@@ -527,7 +592,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                     size_precision=instrument.size_precision,
                     report_id=UUID4(),
                     enum_parser=self._enum_parser,
-                    ts_init=self._clock.timestamp_ns(),
+                    ts_init=ts_init,
                 )
                 reports.append(report)
         else:
@@ -567,6 +632,9 @@ class DYDXExecutionClient(LiveExecutionClient):
         )
 
         if dydx_fills is not None:
+            # All reports in the batch are initialized from the same response
+            ts_init = self._clock.timestamp_ns()
+
             for dydx_fill in dydx_fills.fills:
                 client_order_id = None
 
@@ -577,7 +645,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                         "Venue order ID not set by venue. Unable to retrieve ClientOrderId",
                     )
 
-                current_instrument_id = DYDXSymbol(dydx_fill.market).to_instrument_id()
+                current_instrument_id = self._get_instrument_id(dydx_fill.market)
                 instrument = self._cache.instrument(current_instrument_id)
 
                 if instrument is None:
@@ -600,7 +668,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                     size_precision=instrument.size_precision,
                     report_id=UUID4(),
                     enum_parser=self._enum_parser,
-                    ts_init=self._clock.timestamp_ns(),
+                    ts_init=ts_init,
                 )
                 reports.append(report)
         else:
@@ -630,9 +698,12 @@ class DYDXExecutionClient(LiveExecutionClient):
         )
 
         if dydx_positions is not None:
+            # All reports in the batch are initialized from the same response
+            ts_init = self._clock.timestamp_ns()
+
             if instrument_id:
                 for dydx_position in dydx_positions.positions:
-                    current_instrument_id = DYDXSymbol(dydx_position.market).to_instrument_id()
+                    current_instrument_id = self._get_instrument_id(dydx_position.market)
 
                     if current_instrument_id == instrument_id:
                         instrument = self._cache.instrument(current_instrument_id)
@@ -648,25 +719,24 @@ class DYDXExecutionClient(LiveExecutionClient):
                             size_precision=instrument.size_precision,
                             report_id=UUID4(),
                             enum_parser=self._enum_parser,
-                            ts_init=self._clock.timestamp_ns(),
+                            ts_init=ts_init,
                         )
                         reports.append(report)
 
                 if not reports:
-                    now = self._clock.timestamp_ns()
                     report = PositionStatusReport(
                         account_id=self.account_id,
                         instrument_id=instrument_id,
                         position_side=PositionSide.FLAT,
                         quantity=Quantity.zero(),
                         report_id=UUID4(),
-                        ts_last=now,
-                        ts_init=now,
+                        ts_last=ts_init,
+                        ts_init=ts_init,
                     )
                     reports = [report]
             else:
                 for dydx_position in dydx_positions.positions:
-                    current_instrument_id = DYDXSymbol(dydx_position.market).to_instrument_id()
+                    current_instrument_id = self._get_instrument_id(dydx_position.market)
 
                     instrument = self._cache.instrument(current_instrument_id)
 
@@ -681,7 +751,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                         size_precision=instrument.size_precision,
                         report_id=UUID4(),
                         enum_parser=self._enum_parser,
-                        ts_init=self._clock.timestamp_ns(),
+                        ts_init=ts_init,
                     )
                     reports.append(report)
         else:
@@ -695,11 +765,10 @@ class DYDXExecutionClient(LiveExecutionClient):
     def _handle_ws_message(self, raw: bytes) -> None:
         try:
             ws_message = self._decoder_ws_msg_general.decode(raw)
+            handler = self._ws_handlers.get((ws_message.channel, ws_message.type))
 
-            if ws_message.channel == "v4_subaccounts" and ws_message.type == "channel_data":
-                self._handle_subaccounts_channel_data(raw)
-            elif ws_message.channel == "v4_subaccounts" and ws_message.type == "subscribed":
-                self._handle_subaccounts_subscribed(raw)
+            if handler is not None:
+                handler(raw)
             elif ws_message.type == "unsubscribed":
                 self._log.info(
                     f"Unsubscribed from channel {ws_message.channel} for {ws_message.id}",
@@ -727,7 +796,7 @@ class DYDXExecutionClient(LiveExecutionClient):
             instruments = self._instrument_provider.get_all()
 
             for perpetual_position in msg.contents.subaccount.openPerpetualPositions.values():
-                instrument_id = DYDXSymbol(perpetual_position.market).to_instrument_id()
+                instrument_id = self._get_instrument_id(perpetual_position.market)
                 instrument = self._cache.instrument(instrument_id)
 
                 if instrument is None:
@@ -801,7 +870,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                 client_order_id_int=int(order_msg.clientId),
             )
 
-        instrument_id = DYDXSymbol(order_msg.ticker).to_instrument_id()
+        instrument_id = self._get_instrument_id(order_msg.ticker)
         instrument = self._cache.instrument(instrument_id)
 
         if instrument is None:
@@ -818,21 +887,18 @@ class DYDXExecutionClient(LiveExecutionClient):
             ts_init=self._clock.timestamp_ns(),
         )
 
-        strategy_id = None
+        order = None
 
         if report.client_order_id:
-            strategy_id = self._cache.strategy_id_for_order(report.client_order_id)
+            # Resolve the order with a single cache lookup, the strategy ID is held by the order
+            order = self._cache.order(report.client_order_id)
 
-        if strategy_id is None:
+        if order is None:
             # External order
             self._send_order_status_report(report)
             return
 
-        order = self._cache.order(report.client_order_id)
-
-        if order is None:
-            self._log.error(f"Cannot handle order event: order {report.client_order_id} not found")
-            return
+        strategy_id = order.strategy_id
 
         if order_msg.status in (DYDXOrderStatus.BEST_EFFORT_OPENED, DYDXOrderStatus.OPEN):
             self.generate_order_accepted(
@@ -851,6 +917,8 @@ class DYDXExecutionClient(LiveExecutionClient):
                     venue_order_id=report.venue_order_id,
                     ts_event=report.ts_last,
                 )
+
+            self._release_order(report.client_order_id)
         elif order_msg.status in (
             DYDXOrderStatus.UNTRIGGERED,
             DYDXOrderStatus.BEST_EFFORT_CANCELED,
@@ -869,12 +937,13 @@ class DYDXExecutionClient(LiveExecutionClient):
             # Skip order filled message. The _handle_fill_message generates
             # a fill report.
             self._log.debug(f"Skip order fill message: {order_msg}")
+            self._release_order(report.client_order_id)
         else:
             message = f"Unknown order status `{order_msg.status}`"
             self._log.error(message)
 
     def _handle_fill_message(self, fill_msg: DYDXWsFillSubaccountMessageContents) -> None:
-        instrument_id = DYDXSymbol(fill_msg.ticker).to_instrument_id()
+        instrument_id = self._get_instrument_id(fill_msg.ticker)
         instrument = self._cache.instrument(instrument_id)
 
         if instrument is None:
@@ -926,6 +995,27 @@ class DYDXExecutionClient(LiveExecutionClient):
             ts_event=dt_to_unix_nanos(fill_msg.createdAt),
         )
 
+    def _release_order(self, client_order_id: ClientOrderId) -> None:
+        """
+        Free the per-order state held by the client once the order is closed at the
+        venue, bounding its growth over a long running session.
+        """
+        self._client_order_id_generator.release(client_order_id)
+        self._generate_order_status_retries.pop(client_order_id, None)
+
+    def _get_instrument_id(self, symbol: str) -> InstrumentId:
+        """
+        Parse a dYdX market symbol into an instrument ID, reusing previously parsed
+        IDs for the same symbol.
+        """
+        instrument_id = self._instrument_ids.get(symbol)
+
+        if instrument_id is None:
+            instrument_id = DYDXSymbol(symbol).to_instrument_id()
+            self._instrument_ids[symbol] = instrument_id
+
+        return instrument_id
+
     def _get_order_builder(self, instrument: Instrument) -> OrderBuilder:
         """
         Construct an OrderBuilder for a specific instrument.
@@ -1025,6 +1115,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                 reason=rejection_reason,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._release_order(order.client_order_id)
             return
 
         if dydx_order_tags.is_short_term_order:
@@ -1039,6 +1130,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                     reason=rejection_reason,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._release_order(order.client_order_id)
                 return
 
             good_til_block = latest_block + dydx_order_tags.num_blocks_open
@@ -1054,24 +1146,6 @@ class DYDXExecutionClient(LiveExecutionClient):
             client_id=client_order_id_int,
             order_flags=order_flags,
         )
-        order_type_map = {
-            OrderType.LIMIT: DYDXGRPCOrderType.LIMIT,
-            OrderType.MARKET: DYDXGRPCOrderType.MARKET,
-            OrderType.STOP_MARKET: DYDXGRPCOrderType.STOP_MARKET,
-            OrderType.STOP_LIMIT: DYDXGRPCOrderType.STOP_LIMIT,
-        }
-        order_side_map = {
-            OrderSide.NO_ORDER_SIDE: DYDXOrder.Side.SIDE_UNSPECIFIED,
-            OrderSide.BUY: DYDXOrder.Side.SIDE_BUY,
-            OrderSide.SELL: DYDXOrder.Side.SIDE_SELL,
-        }
-        time_in_force_map = {
-            TimeInForce.GTC: DYDXOrder.TimeInForce.TIME_IN_FORCE_UNSPECIFIED,
-            TimeInForce.GTD: DYDXOrder.TimeInForce.TIME_IN_FORCE_UNSPECIFIED,
-            TimeInForce.IOC: DYDXOrder.TimeInForce.TIME_IN_FORCE_IOC,
-            TimeInForce.FOK: DYDXOrder.TimeInForce.TIME_IN_FORCE_FILL_OR_KILL,
-        }
-
         price = 0
         trigger_price = None
 
@@ -1096,15 +1170,16 @@ class DYDXExecutionClient(LiveExecutionClient):
                 reason=rejection_reason,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._release_order(order.client_order_id)
             return
 
         order_msg = order_builder.create_order(
             order_id=order_id,
-            order_type=order_type_map[order.order_type],
-            side=order_side_map[order.side],
+            order_type=self._order_type_map[order.order_type],
+            side=self._order_side_map[order.side],
             size=order.quantity.as_double(),
             price=price,
-            time_in_force=time_in_force_map[order.time_in_force],
+            time_in_force=self._time_in_force_map[order.time_in_force],
             reduce_only=order.is_reduce_only,
             post_only=order.is_post_only,
             good_til_block=good_til_block,
@@ -1126,6 +1201,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                 reason=rejection_reason,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._release_order(order.client_order_id)
             return
 
         async with self._retry_manager_pool as retry_manager:
@@ -1144,6 +1220,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                     reason=retry_manager.message,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._release_order(order.client_order_id)
 
     async def _submit_order(self, command: SubmitOrder) -> None:
         await self._submit_order_single(order=command.order)
@@ -1284,6 +1361,9 @@ class DYDXExecutionClient(LiveExecutionClient):
                 if not retry_manager.result:
                     self._log.error(f"Failed to cancel batch of orders: {retry_manager.message}")
 
+                    # The whole batch was rejected at once
+                    ts_event = self._clock.timestamp_ns()
+
                     for order in orders:
                         self.generate_order_cancel_rejected(
                             strategy_id=order.strategy_id,
@@ -1291,7 +1371,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                             client_order_id=order.client_order_id,
                             venue_order_id=order.venue_order_id,
                             reason=retry_manager.message,
-                            ts_event=self._clock.timestamp_ns(),
+                            ts_event=ts_event,
                         )
 
     async def _cancel_order_single(
@@ -1373,11 +1453,8 @@ class DYDXExecutionClient(LiveExecutionClient):
             )
             return
 
-        is_expired = (
-            nanos_to_secs(self._clock.timestamp_ns()) > good_til_date_secs
-            if good_til_date_secs
-            else False
-        )
+        ts_now = self._clock.timestamp_ns()
+        is_expired = nanos_to_secs(ts_now) > good_til_date_secs if good_til_date_secs else False
 
         if is_expired:
             reason = f"Cannot cancel order: order {order.client_order_id!r} is expired"
@@ -1388,7 +1465,7 @@ class DYDXExecutionClient(LiveExecutionClient):
                 client_order_id=order.client_order_id,
                 venue_order_id=order.venue_order_id,
                 reason=reason,
-                ts_event=self._clock.timestamp_ns(),
+                ts_event=ts_now,
             )
             return
 
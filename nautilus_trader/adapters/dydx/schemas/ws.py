@@ -147,7 +147,7 @@ class DYDXWsCandlesSubscribedData(msgspec.Struct, forbid_unknown_fields=True):
     type: str
 
 
-class DYDXWsMessageGeneral(msgspec.Struct):
+class DYDXWsMessageGeneral(msgspec.Struct, gc=False):
     """
     Define a general websocket message from dYdX.
     """
@@ -604,7 +604,7 @@ class DYDXWsTransferSubaccountMessageContents(msgspec.Struct, forbid_unknown_fie
     transactionHash: str
 
 
-class DYDXWsFillEventId(msgspec.Struct, forbid_unknown_fields=True):
+class DYDXWsFillEventId(msgspec.Struct, forbid_unknown_fields=True, gc=False):
     """
     Define the event id object of a fill message.
     """
@@ -613,7 +613,7 @@ class DYDXWsFillEventId(msgspec.Struct, forbid_unknown_fields=True):
     type: str
 
 
-class DYDXWsFillSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True):
+class DYDXWsFillSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True, gc=False):
     """
     Define a fill update message.
     """
@@ -638,7 +638,7 @@ class DYDXWsFillSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=
     affiliateRevShare: str | None = None
 
 
-class DYDXWsOrderSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True):
+class DYDXWsOrderSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True, gc=False):
     """
     Define an order update message.
     """
@@ -775,7 +775,7 @@ class DYDXTradingReward(msgspec.Struct, forbid_unknown_fields=True):
     tradingReward: str
 
 
-class DYDXWsSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True):
+class DYDXWsSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True, gc=False):
     """
     Define the contents of a subaccount message.
     """
@@ -799,7 +799,7 @@ class DYDXWsSubaccountMessageContents(msgspec.Struct, forbid_unknown_fields=True
     tradingReward: DYDXTradingReward | None = None
 
 
-class DYDXWsSubaccountsChannelData(msgspec.Struct, forbid_unknown_fields=True):
+class DYDXWsSubaccountsChannelData(msgspec.Struct, forbid_unknown_fields=True, gc=False):
     """
     Define the schema for subaccounts updates.
 
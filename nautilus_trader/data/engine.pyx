@@ -179,7 +179,7 @@ cdef class DataEngine(Component):
         list[ClientId]
 
         """
-        return sorted(list(self._clients.keys()))
+        return sorted(self._clients)
 
     @property
     def default_client(self) -> ClientId | None:
@@ -39,6 +39,7 @@ from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderCancelRejected
+from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.order cimport OrderExpired
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderModifyRejected
@@ -791,13 +792,13 @@ cdef class ExecutionClient(Component):
 
 # --------------------------------------------------------------------------------------------------
 
-    cpdef void _send_account_state(self, account_state: AccountState):
+    cpdef void _send_account_state(self, AccountState account_state):
         self._msgbus.send(
-            endpoint=f"Portfolio.update_account",
+            endpoint="Portfolio.update_account",
             msg=account_state,
         )
 
-    cpdef void _send_order_event(self, event: OrderEvent):
+    cpdef void _send_order_event(self, OrderEvent event):
         self._msgbus.send(
             endpoint="ExecEngine.process",
             msg=event,
@@ -51,6 +51,8 @@ cdef class ExecutionEngine(Component):
     cdef readonly dict[Venue, ExecutionClient] _routing_map
     cdef readonly dict[StrategyId, OmsType] _oms_overrides
     cdef readonly dict[InstrumentId, StrategyId] _external_order_claims
+    cdef dict[StrategyId, str] _topic_cache_order_events
+    cdef dict[StrategyId, str] _topic_cache_position_events
     cdef readonly str snapshot_positions_timer_name
 
     cdef readonly bint debug
@@ -96,6 +98,8 @@ cdef class ExecutionEngine(Component):
     cpdef Price _last_px_for_conversion(self, InstrumentId instrument_id, OrderSide order_side)
     cpdef void _set_order_base_qty(self, Order order, Quantity base_qty)
     cpdef void _deny_order(self, Order order, str reason)
+    cdef str _get_order_events_topic(self, StrategyId strategy_id)
+    cdef str _get_position_events_topic(self, StrategyId strategy_id)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -140,6 +140,10 @@ cdef class ExecutionEngine(Component):
         self._oms_overrides: dict[StrategyId, OmsType] = {}
         self._external_order_claims: dict[InstrumentId, StrategyId] = {}
 
+        # Topic cache
+        self._topic_cache_order_events: dict[StrategyId, str] = {}
+        self._topic_cache_position_events: dict[StrategyId, str] = {}
+
         self._pos_id_generator: PositionIdGenerator = PositionIdGenerator(
             trader_id=msgbus.trader_id,
             clock=clock,
@@ -188,7 +192,7 @@ cdef class ExecutionEngine(Component):
         list[ClientId]
 
         """
-        return sorted(list(self._clients.keys()))
+        return sorted(self._clients)
 
     @property
     def default_client(self) -> ClientId | None:
@@ -316,7 +320,7 @@ cdef class ExecutionEngine(Component):
         set[InstrumentId]
 
         """
-        return set(self._external_order_claims.keys())
+        return set(self._external_order_claims)
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
 
@@ -741,12 +745,28 @@ cdef class ExecutionEngine(Component):
 
         self._cache.update_order(order)
         self._msgbus.publish_c(
-            topic=f"events.order.{order.strategy_id}",
+            topic=self._get_order_events_topic(order.strategy_id),
             msg=denied,
         )
         if self.snapshot_orders:
             self._create_order_state_snapshot(order)
 
+    cdef str _get_order_events_topic(self, StrategyId strategy_id):
+        cdef str topic = self._topic_cache_order_events.get(strategy_id)
+        if topic is None:
+            topic = f"events.order.{strategy_id}"
+            self._topic_cache_order_events[strategy_id] = topic
+
+        return topic
+
+    cdef str _get_position_events_topic(self, StrategyId strategy_id):
+        cdef str topic = self._topic_cache_position_events.get(strategy_id)
+        if topic is None:
+            topic = f"events.position.{strategy_id}"
+            self._topic_cache_position_events[strategy_id] = topic
+
+        return topic
+
 # -- COMMAND HANDLERS -----------------------------------------------------------------------------
 
     cpdef void _execute_command(self, TradingCommand command):
@@ -1049,7 +1069,7 @@ cdef class ExecutionEngine(Component):
 
         self._cache.update_order(order)
         self._msgbus.publish_c(
-            topic=f"events.order.{event.strategy_id}",
+            topic=self._get_order_events_topic(event.strategy_id),
             msg=event,
         )
         if self.snapshot_orders:
@@ -1120,7 +1140,7 @@ cdef class ExecutionEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"events.position.{event.strategy_id}",
+            topic=self._get_position_events_topic(event.strategy_id),
             msg=event,
         )
 
@@ -1155,7 +1175,7 @@ cdef class ExecutionEngine(Component):
             )
 
         self._msgbus.publish_c(
-            topic=f"events.position.{event.strategy_id}",
+            topic=self._get_position_events_topic(event.strategy_id),
             msg=event,
         )
 
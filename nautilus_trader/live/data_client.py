@@ -451,7 +451,7 @@ class LiveMarketDataClient(MarketDataClient):
         )
 
     def subscribe_instruments(self) -> None:
-        instrument_ids = list(self._instrument_provider.get_all().keys())
+        instrument_ids = list(self._instrument_provider.get_all())
         [self._add_subscription_instrument(i) for i in instrument_ids]
         self.create_task(
             self._subscribe_instruments(),
@@ -569,7 +569,7 @@ class LiveMarketDataClient(MarketDataClient):
         )
 
     def unsubscribe_instruments(self) -> None:
-        instrument_ids = list(self._instrument_provider.get_all().keys())
+        instrument_ids = list(self._instrument_provider.get_all())
         [self._remove_subscription_instrument(i) for i in instrument_ids]
         self.create_task(
             self._unsubscribe_instruments(),
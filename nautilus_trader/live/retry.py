@@ -16,6 +16,7 @@
 import asyncio
 from collections.abc import Awaitable
 from collections.abc import Callable
+from contextvars import ContextVar
 from typing import Generic, TypeVar
 
 from nautilus_trader.common.component import Logger
@@ -220,9 +221,15 @@ class RetryManagerPool:
         self.pool_size = pool_size
         self._pool: list[RetryManager] = [self._create_manager() for _ in range(pool_size)]
         self._lock = asyncio.Lock()
-        self._current_manager: RetryManager | None = None
         self._active_managers: set[RetryManager] = set()
 
+        # Managers acquired through the context manager are tracked per task context,
+        # so concurrent tasks sharing the pool each release their own manager.
+        self._context_managers: ContextVar[tuple[RetryManager, ...]] = ContextVar(
+            f"retry_managers_{id(self)}",
+            default=(),
+        )
+
     def _create_manager(self) -> RetryManager:
         return RetryManager(
             max_retries=self.max_retries,
@@ -239,8 +246,9 @@ class RetryManagerPool:
         Acquires a `RetryManager` from the pool.
 
         """
-        self._current_manager = await self.acquire()
-        return self._current_manager
+        retry_manager = await self.acquire()
+        self._context_managers.set((*self._context_managers.get(), retry_manager))
+        return retry_manager
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
         """
@@ -249,12 +257,13 @@ class RetryManagerPool:
         Releases the `RetryManager` back into the pool.
 
         """
-        try:
-            if self._current_manager:
-                await self.release(self._current_manager)
-        finally:
-            # Drop reference to avoid lingering state issues
-            self._current_manager = None
+        retry_managers = self._context_managers.get()
+        if not retry_managers:
+            return
+
+        # Drop reference to avoid lingering state issues
+        self._context_managers.set(retry_managers[:-1])
+        await self.release(retry_managers[-1])
 
     def shutdown(self) -> None:
         """
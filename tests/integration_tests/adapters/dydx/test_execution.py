@@ -124,3 +124,38 @@ def test_retrieve_client_order_id_integer_from_empty_cache(client_order_id_helpe
 
     # Assert
     assert result == expected_result
+
+
+def test_retrieve_generated_client_order_id_round_trip(client_order_id_helper) -> None:
+    """
+    Test a generated client order ID integer maps back to the original ClientOrderId.
+    """
+    # Prepare
+    client_order_id = ClientOrderId(str(uuid4()))
+    client_order_id_int = client_order_id_helper.generate_client_order_id_int(client_order_id)
+
+    # Act
+    result_int = client_order_id_helper.get_client_order_id_int(client_order_id)
+    result = client_order_id_helper.get_client_order_id(client_order_id_int)
+
+    # Assert
+    assert result_int == client_order_id_int
+    assert result == client_order_id
+
+
+def test_release_client_order_id_falls_back_to_cache(client_order_id_helper) -> None:
+    """
+    Test a released client order ID is still resolved through the cache.
+    """
+    # Prepare
+    client_order_id = ClientOrderId(str(uuid4()))
+    client_order_id_int = client_order_id_helper.generate_client_order_id_int(client_order_id)
+
+    # Act
+    client_order_id_helper.release(client_order_id)
+    result_int = client_order_id_helper.get_client_order_id_int(client_order_id)
+    result = client_order_id_helper.get_client_order_id(client_order_id_int)
+
+    # Assert
+    assert result_int == client_order_id_int
+    assert result == client_order_id
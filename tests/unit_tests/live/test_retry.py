@@ -151,6 +151,32 @@ async def test_retry_manager_pool_create_new_when_empty(mock_logger):
     assert len(pool._pool) == pool_size
 
 
+@pytest.mark.asyncio
+async def test_retry_manager_pool_concurrent_tasks_release_own_managers(mock_logger):
+    # Arrange
+    pool_size = 2
+    pool = RetryManagerPool(
+        pool_size=pool_size,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    initial_managers = set(pool._pool)
+
+    async def use_pool(delay: float) -> None:
+        async with pool:
+            await asyncio.sleep(delay)
+
+    # Act
+    await asyncio.gather(use_pool(0.1), use_pool(0.05))
+
+    # Assert
+    assert len(pool._pool) == pool_size
+    assert set(pool._pool) == initial_managers
+    assert not pool._active_managers
+
+
 @pytest.mark.asyncio
 async def test_retry_manager_with_retry_check(mock_logger):
     # Arrange